@@ -1,14 +1,14 @@
 # Interactive Superstore Sales Dashboard
 # Using Streamlit for interactive visualizations
 
+import os
 import streamlit as st
 import pandas as pd
+import polars as pl
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import warnings
-warnings.filterwarnings('ignore')
 
 # Page configuration
 st.set_page_config(
@@ -39,25 +39,197 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Load data
-@st.cache_data
+CSV_PATH = 'Superstore.csv'
+# Prepared frame cached next to the CSV; rebuilt whenever the CSV is newer.
+# Bump CACHE_VERSION whenever load_data() changes the columns or dtypes it
+# produces, so caches written by older code are ignored rather than reused.
+CACHE_VERSION = 3
+PARQUET_PATH = f'Superstore_dashboard_v{CACHE_VERSION}.parquet'
+
+# Repeated string columns are stored as categoricals so groupbys hash integer codes
+CAT_COLS = ['Category', 'Sub-Category', 'Region', 'State', 'Ship Mode', 'Segment',
+            'Customer Name', 'Product Name', 'Country', 'Order Day of Week', 'Period',
+            'Order ID']
+
+# Load data once per server process; callers only read from the shared frame
+@st.cache_resource(show_spinner=False)
 def load_data():
-    df = pd.read_csv('Superstore.csv', encoding='latin-1')
-    df['Order Date'] = pd.to_datetime(df['Order Date'], dayfirst=True, errors='coerce')
-    df['Ship Date'] = pd.to_datetime(df['Ship Date'], dayfirst=True, errors='coerce')
-    
-    # Create additional features
-    df['Order Year'] = df['Order Date'].dt.year
-    df['Order Month'] = df['Order Date'].dt.month
-    df['Order Quarter'] = df['Order Date'].dt.quarter
-    df['Order Day of Week'] = df['Order Date'].dt.day_name()
-    df['Shipping Days'] = (df['Ship Date'] - df['Order Date']).dt.days
-    df['Profit Margin'] = (df['Profit'] / df['Sales'] * 100).round(2)
-    
-    return df.dropna(subset=['Postal Code'])
+    if os.path.exists(PARQUET_PATH) and os.path.getmtime(PARQUET_PATH) >= os.path.getmtime(CSV_PATH):
+        return pd.read_parquet(PARQUET_PATH, engine='pyarrow')
+    
+    # Parse dates and derive features in a single Polars plan
+    df = pl.read_csv(CSV_PATH, encoding='latin1').lazy().with_columns(
+        pl.col('Order Date').str.to_datetime('%d-%m-%Y', strict=False),
+        pl.col('Ship Date').str.to_datetime('%d-%m-%Y', strict=False),
+    ).with_columns(
+        pl.col('Order Date').dt.year().alias('Order Year'),
+        pl.col('Order Date').dt.month().alias('Order Month'),
+        pl.col('Order Date').dt.quarter().alias('Order Quarter'),
+        pl.col('Order Date').dt.strftime('%A').alias('Order Day of Week'),
+        pl.col('Order Date').dt.strftime('%Y-%m').alias('Period'),
+        (pl.col('Ship Date') - pl.col('Order Date')).dt.total_days().alias('Shipping Days'),
+        pl.when(pl.col('Sales') != 0).then(pl.col('Profit') / pl.col('Sales') * 100).otherwise(0)
+            .round(2).cast(pl.Float32).alias('Profit Margin'),
+    ).drop_nulls(subset=['Postal Code']).with_columns(
+        pl.col('Postal Code').cast(pl.Int32),
+        pl.col('Quantity').cast(pl.Int16),
+        pl.col('Shipping Days').cast(pl.Int16),
+        pl.col('Discount').cast(pl.Float32),
+    ).sort('Order Date', nulls_last=True, maintain_order=True).collect().to_pandas()
+    
+    # Sorted categories keep groupby output in the same order as the string keys
+    df[CAT_COLS] = df[CAT_COLS].astype('category')
+    
+    # Bins are right-closed like pd.cut: (0, 0.1], (0.1, 0.2], ...; code -1 is NaN.
+    # Edges share the column's float32 dtype so values like 0.1 land on the closed edge
+    discount = df['Discount'].to_numpy()
+    discount_edges = np.array([0, 0.1, 0.2, 0.3, 0.4, 0.5, 1.0], dtype=discount.dtype)
+    discount_labels = ['0-10%', '10-20%', '20-30%', '30-40%', '40-50%', '50%+']
+    discount_codes = np.searchsorted(discount_edges, discount, side='left') - 1
+    discount_codes[discount_codes >= len(discount_labels)] = -1
+    df['Discount_Bin'] = pd.Categorical.from_codes(discount_codes, categories=discount_labels)
+    
+    # The cache is only an optimization: write it atomically (a partial file must
+    # never pass the mtime check) and keep serving from memory if the directory is
+    # read-only or the write fails
+    tmp_path = f'{PARQUET_PATH}.{os.getpid()}.tmp'
+    try:
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+        os.replace(tmp_path, PARQUET_PATH)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return df
+
+def filter_positions(data, date_range, category, region):
+    lo, hi = 0, len(data)
+    if len(date_range) == 2:
+        # Rows are sorted by Order Date, so the date range is one contiguous slice
+        lo, hi = np.searchsorted(
+            data['Order Date'].to_numpy(),
+            [np.datetime64(date_range[0]), np.datetime64(date_range[1]) + np.timedelta64(1, 'D')]
+        )
+    
+    # One mask over the slice, comparing categorical codes instead of strings
+    mask = np.ones(hi - lo, dtype=bool)
+    if category != 'All':
+        mask &= data['Category'].cat.codes.to_numpy()[lo:hi] == data['Category'].cat.categories.get_loc(category)
+    
+    if region != 'All':
+        mask &= data['Region'].cat.codes.to_numpy()[lo:hi] == data['Region'].cat.categories.get_loc(region)
+    
+    return lo + np.flatnonzero(mask)
+
+# Distinct values of a categorical Series, counted from its codes in one bincount
+def fast_nunique(s):
+    codes = s.cat.codes.to_numpy()
+    return int(np.count_nonzero(np.bincount(codes[codes >= 0], minlength=len(s.cat.categories))))
+
+# The k rows with the largest col: argpartition picks them, then only those k get sorted
+def top_k(frame, col, k=10):
+    vals = frame[col].to_numpy()
+    idx = np.argpartition(-vals, k)[:k] if len(vals) > k else np.arange(len(vals))
+    return frame.iloc[idx[np.argsort(-vals[idx], kind='stable')]]
+
+# Cached aggregates keyed on the sidebar filter tuple (date_range, category, region).
+# The frame argument is underscored so Streamlit does not hash it on every call.
+@st.cache_data(max_entries=32)
+def filter_rows(_data, filters):
+    return filter_positions(_data, *filters)
+
+def select_rows(data, filters):
+    return data.iloc[filter_rows(data, filters)]
+
+# Polars copy of the data for the per-tab groupbys
+@st.cache_resource
+def polars_data(_data):
+    return pl.from_pandas(_data, rechunk=True)
+
+def select_rows_pl(pl_data, filters):
+    date_range, category, region = filters
+    selection = pl.lit(True)
+    if len(date_range) == 2:
+        selection &= pl.col('Order Date').dt.date().is_between(date_range[0], date_range[1])
+    if category != 'All':
+        selection &= pl.col('Category') == category
+    if region != 'All':
+        selection &= pl.col('Region') == region
+    return pl_data.lazy().filter(selection)
+
+
+# Sales and Profit totals per key plus any extra aggregations, with the margin
+# computed inside the same plan; None means a zero-sales group. Null keys are
+# dropped like pandas groupby does (e.g. zero discounts have no Discount_Bin).
+def sales_agg(pl_data, filters, key, *aggs, sort=True):
+    plan = select_rows_pl(pl_data, filters).group_by(key).agg(
+        pl.col('Sales').sum(),
+        pl.col('Profit').sum(),
+        *aggs
+    ).drop_nulls(key).with_columns(
+        pl.when(pl.col('Sales') != 0).then(pl.col('Profit') / pl.col('Sales') * 100).alias('Profit_Margin')
+    )
+    if sort:
+        plan = plan.sort(key)
+    return plan.collect().to_pandas()
+
+# Zero-padded '%Y-%m' periods sort chronologically
+@st.cache_data(max_entries=32)
+def monthly_sales_agg(_pl_data, filters):
+    return select_rows_pl(_pl_data, filters).group_by('Period').agg(
+        pl.col('Sales').sum()
+    ).sort('Period').collect().to_pandas()
+
+@st.cache_data(max_entries=32)
+def category_agg(_pl_data, filters):
+    return sales_agg(_pl_data, filters, 'Category')
+
+@st.cache_data(max_entries=32)
+def customer_agg(_pl_data, filters):
+    customer_analysis = select_rows_pl(_pl_data, filters).group_by('Customer Name').agg(
+        pl.col('Sales').sum(),
+        pl.col('Profit').sum(),
+        pl.col('Order ID').n_unique().alias('Orders')
+    ).collect().to_pandas()
+    
+    # Right-closed segment bins (0, 1000], (1000, 5000], ...; code -1 is NaN
+    segment_edges = np.array([0, 1000, 5000, 10000, np.inf])
+    segment_labels = ['Bronze', 'Silver', 'Gold', 'Platinum']
+    segment_codes = np.searchsorted(segment_edges, customer_analysis['Sales'].to_numpy(), side='left') - 1
+    segment_codes[segment_codes >= len(segment_labels)] = -1
+    customer_analysis['Customer_Segment'] = pd.Categorical.from_codes(segment_codes, categories=segment_labels)
+    return customer_analysis
+
+@st.cache_data(max_entries=32)
+def product_agg(_pl_data, filters):
+    return sales_agg(_pl_data, filters, 'Product Name', pl.col('Quantity').sum(), sort=False)
+
+@st.cache_data(max_entries=32)
+def subcategory_agg(_pl_data, filters):
+    return sales_agg(_pl_data, filters, 'Sub-Category')
+
+@st.cache_data(max_entries=32)
+def regional_agg(_pl_data, filters):
+    return sales_agg(_pl_data, filters, 'Region',
+                     pl.col('Customer Name').n_unique().alias('Customers'),
+                     pl.col('Order ID').n_unique().alias('Orders'))
+
+@st.cache_data(max_entries=32)
+def state_agg(_pl_data, filters):
+    return sales_agg(_pl_data, filters, 'State', sort=False)
+
+@st.cache_data(max_entries=32)
+def shipping_agg(_pl_data, filters):
+    return sales_agg(_pl_data, filters, 'Ship Mode',
+                     pl.col('Order ID').n_unique().alias('Orders'),
+                     pl.col('Shipping Days').mean().alias('Shipping_Days'))
+
+@st.cache_data(max_entries=32)
+def discount_agg(_pl_data, filters):
+    return sales_agg(_pl_data, filters, 'Discount_Bin')
 
 # Load data
 df = load_data()
+pl_df = polars_data(df)
 
 # Header
 st.markdown('<h1 class="main-header">📊 Superstore Sales Dashboard</h1>', unsafe_allow_html=True)
@@ -84,28 +256,22 @@ regions = ['All'] + list(df['Region'].unique())
 selected_region = st.sidebar.selectbox("Select Region", regions)
 
 # Apply filters
-filtered_df = df.copy()
-if len(date_range) == 2:
-    filtered_df = filtered_df[
-        (filtered_df['Order Date'].dt.date >= date_range[0]) &
-        (filtered_df['Order Date'].dt.date <= date_range[1])
-    ]
+filters = (date_range, selected_category, selected_region)
+filtered_df = select_rows(df, filters)
 
-if selected_category != 'All':
-    filtered_df = filtered_df[filtered_df['Category'] == selected_category]
-
-if selected_region != 'All':
-    filtered_df = filtered_df[filtered_df['Region'] == selected_region]
+# Headline totals, shared by the metric cards and the customer tab
+totals = filtered_df[['Sales', 'Profit']].sum()
+total_sales, total_profit = totals['Sales'], totals['Profit']
+total_orders = fast_nunique(filtered_df['Order ID'])
+total_customers = fast_nunique(filtered_df['Customer Name'])
 
 # Key Metrics Row
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    total_sales = filtered_df['Sales'].sum()
     st.metric("💰 Total Sales", f"${total_sales:,.0f}")
 
 with col2:
-    total_profit = filtered_df['Profit'].sum()
     st.metric("📈 Total Profit", f"${total_profit:,.0f}")
 
 with col3:
@@ -113,7 +279,6 @@ with col3:
     st.metric("🎯 Profit Margin", f"{profit_margin:.1f}%")
 
 with col4:
-    total_orders = filtered_df['Order ID'].nunique()
     st.metric("📦 Total Orders", f"{total_orders:,}")
 
 # Tabs for different analyses
@@ -127,8 +292,7 @@ with tab1:
     
     with col1:
         # Monthly sales trend
-        monthly_sales = filtered_df.groupby(['Order Year', 'Order Month'])['Sales'].sum().reset_index()
-        monthly_sales['Period'] = monthly_sales['Order Year'].astype(str) + '-' + monthly_sales['Order Month'].astype(str).str.zfill(2)
+        monthly_sales = monthly_sales_agg(pl_df, filters)
         
         fig = px.line(monthly_sales, x='Period', y='Sales', 
                      title='Monthly Sales Trend',
@@ -138,8 +302,8 @@ with tab1:
     
     with col2:
         # Sales by category
-        category_sales = filtered_df.groupby('Category')['Sales'].sum().reset_index()
-        fig = px.pie(category_sales, values='Sales', names='Category',
+        category_profit = category_agg(pl_df, filters)
+        fig = px.pie(category_profit, values='Sales', names='Category',
                     title='Sales Distribution by Category')
         fig.update_layout(height=400)
         st.plotly_chart(fig, use_container_width=True)
@@ -149,12 +313,6 @@ with tab1:
     
     with col1:
         # Profit margin by category
-        category_profit = filtered_df.groupby('Category').agg({
-            'Sales': 'sum',
-            'Profit': 'sum'
-        }).reset_index()
-        category_profit['Profit_Margin'] = (category_profit['Profit'] / category_profit['Sales'] * 100)
-        
         fig = px.bar(category_profit, x='Category', y='Profit_Margin',
                     title='Profit Margin by Category',
                     labels={'Profit_Margin': 'Profit Margin (%)'})
@@ -163,9 +321,10 @@ with tab1:
     
     with col2:
         # Sales vs Profit scatter
-        fig = px.scatter(filtered_df, x='Sales', y='Profit', color='Category',
+        fig = px.scatter(filtered_df[['Sales', 'Profit', 'Category']], x='Sales', y='Profit', color='Category',
                         title='Sales vs Profit by Category',
-                        labels={'Sales': 'Sales ($)', 'Profit': 'Profit ($)'})
+                        labels={'Sales': 'Sales ($)', 'Profit': 'Profit ($)'},
+                        render_mode='webgl')
         fig.update_layout(height=400)
         st.plotly_chart(fig, use_container_width=True)
 
@@ -173,17 +332,7 @@ with tab2:
     st.header("👥 Customer Analysis")
     
     # Customer segmentation
-    customer_analysis = filtered_df.groupby('Customer Name').agg({
-        'Sales': 'sum',
-        'Profit': 'sum',
-        'Order ID': 'nunique'
-    }).reset_index()
-    
-    customer_analysis['Customer_Segment'] = pd.cut(
-        customer_analysis['Sales'],
-        bins=[0, 1000, 5000, 10000, float('inf')],
-        labels=['Bronze', 'Silver', 'Gold', 'Platinum']
-    )
+    customer_analysis = customer_agg(pl_df, filters)
     
     col1, col2 = st.columns(2)
     
@@ -197,7 +346,7 @@ with tab2:
     
     with col2:
         # Top customers
-        top_customers = customer_analysis.nlargest(10, 'Sales')
+        top_customers = top_k(customer_analysis, 'Sales')
         fig = px.bar(top_customers, x='Customer Name', y='Sales',
                     title='Top 10 Customers by Sales',
                     labels={'Sales': 'Sales ($)'})
@@ -208,34 +357,27 @@ with tab2:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        total_customers = filtered_df['Customer Name'].nunique()
         st.metric("👥 Total Customers", f"{total_customers:,}")
     
     with col2:
-        avg_order_value = filtered_df['Sales'].sum() / filtered_df['Order ID'].nunique()
+        avg_order_value = total_sales / total_orders
         st.metric("💰 Avg Order Value", f"${avg_order_value:,.0f}")
     
     with col3:
-        customer_lifetime_value = filtered_df['Sales'].sum() / total_customers
+        customer_lifetime_value = total_sales / total_customers
         st.metric("💎 Customer LTV", f"${customer_lifetime_value:,.0f}")
 
 with tab3:
     st.header("📦 Product Analysis")
     
     # Product performance
-    product_analysis = filtered_df.groupby('Product Name').agg({
-        'Sales': 'sum',
-        'Profit': 'sum',
-        'Quantity': 'sum'
-    }).reset_index()
-    
-    product_analysis['Profit_Margin'] = (product_analysis['Profit'] / product_analysis['Sales'] * 100)
+    product_analysis = product_agg(pl_df, filters)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Top products by sales
-        top_products = product_analysis.nlargest(10, 'Sales')
+        top_products = top_k(product_analysis, 'Sales')
         fig = px.bar(top_products, x='Sales', y='Product Name', orientation='h',
                     title='Top 10 Products by Sales',
                     labels={'Sales': 'Sales ($)'})
@@ -244,11 +386,7 @@ with tab3:
     
     with col2:
         # Sub-category analysis
-        subcategory_analysis = filtered_df.groupby('Sub-Category').agg({
-            'Sales': 'sum',
-            'Profit': 'sum'
-        }).reset_index()
-        subcategory_analysis['Profit_Margin'] = (subcategory_analysis['Profit'] / subcategory_analysis['Sales'] * 100)
+        subcategory_analysis = subcategory_agg(pl_df, filters)
         
         fig = px.bar(subcategory_analysis, x='Sub-Category', y='Profit_Margin',
                     title='Profit Margin by Sub-Category',
@@ -260,7 +398,7 @@ with tab3:
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        total_products = filtered_df['Product Name'].nunique()
+        total_products = fast_nunique(filtered_df['Product Name'])
         st.metric("📦 Total Products", f"{total_products:,}")
     
     with col2:
@@ -275,14 +413,7 @@ with tab4:
     st.header("🌍 Geographic Analysis")
     
     # Regional analysis
-    regional_analysis = filtered_df.groupby('Region').agg({
-        'Sales': 'sum',
-        'Profit': 'sum',
-        'Customer Name': 'nunique',
-        'Order ID': 'nunique'
-    }).reset_index()
-    
-    regional_analysis['Profit_Margin'] = (regional_analysis['Profit'] / regional_analysis['Sales'] * 100)
+    regional_analysis = regional_agg(pl_df, filters)
     
     col1, col2 = st.columns(2)
     
@@ -303,16 +434,13 @@ with tab4:
         st.plotly_chart(fig, use_container_width=True)
     
     # State analysis
-    state_analysis = filtered_df.groupby('State').agg({
-        'Sales': 'sum',
-        'Profit': 'sum'
-    }).reset_index().sort_values('Sales', ascending=False)
+    state_analysis = state_agg(pl_df, filters)
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Top states by sales
-        top_states = state_analysis.head(10)
+        top_states = top_k(state_analysis, 'Sales')
         fig = px.bar(top_states, x='State', y='Sales',
                     title='Top 10 States by Sales',
                     labels={'Sales': 'Sales ($)'})
@@ -321,8 +449,7 @@ with tab4:
     
     with col2:
         # State profit margins
-        state_analysis['Profit_Margin'] = (state_analysis['Profit'] / state_analysis['Sales'] * 100)
-        top_profit_states = state_analysis.nlargest(10, 'Profit_Margin')
+        top_profit_states = top_k(state_analysis, 'Profit_Margin')
         fig = px.bar(top_profit_states, x='State', y='Profit_Margin',
                     title='Top 10 States by Profit Margin',
                     labels={'Profit_Margin': 'Profit Margin (%)'})
@@ -333,14 +460,7 @@ with tab5:
     st.header("🚚 Operations Analysis")
     
     # Shipping analysis
-    shipping_analysis = filtered_df.groupby('Ship Mode').agg({
-        'Sales': 'sum',
-        'Profit': 'sum',
-        'Order ID': 'nunique',
-        'Shipping Days': 'mean'
-    }).reset_index()
-    
-    shipping_analysis['Profit_Margin'] = (shipping_analysis['Profit'] / shipping_analysis['Sales'] * 100)
+    shipping_analysis = shipping_agg(pl_df, filters)
     
     col1, col2 = st.columns(2)
     
@@ -361,16 +481,7 @@ with tab5:
         st.plotly_chart(fig, use_container_width=True)
     
     # Discount analysis
-    filtered_df['Discount_Bin'] = pd.cut(filtered_df['Discount'],
-                                        bins=[0, 0.1, 0.2, 0.3, 0.4, 0.5, 1.0],
-                                        labels=['0-10%', '10-20%', '20-30%', '30-40%', '40-50%', '50%+'])
-    
-    discount_analysis = filtered_df.groupby('Discount_Bin').agg({
-        'Sales': 'sum',
-        'Profit': 'sum'
-    }).reset_index()
-    
-    discount_analysis['Profit_Margin'] = (discount_analysis['Profit'] / discount_analysis['Sales'] * 100)
+    discount_analysis = discount_agg(pl_df, filters)
     
     col1, col2 = st.columns(2)
     
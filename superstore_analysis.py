@@ -9,6 +9,8 @@ import seaborn as sns
 # Set visualization styles
 sns.set_theme(style="whitegrid")
 plt.rcParams["figure.figsize"] = (10, 6)
+plt.rcParams["savefig.dpi"] = 120
+plt.rcParams["savefig.bbox"] = "tight"
 
 ## 2. Load Dataset
 df = pd.read_csv('Superstore.csv', encoding='latin-1')
@@ -43,20 +45,20 @@ print("New shape after cleaning:", df.shape)
 
 # Sales Distribution
 plt.figure(figsize=(10, 6))
-sns.histplot(df['Sales'], bins=50, kde=True, color='skyblue')
+sns.histplot(df['Sales'], bins=50, kde=False, color='skyblue')
 plt.title('Sales Distribution')
 plt.xlabel('Sales')
 plt.ylabel('Frequency')
-plt.savefig('sales_distribution.png', dpi=300, bbox_inches='tight')
+plt.savefig('sales_distribution.png')
 plt.close()
 
 # Profit Distribution
 plt.figure(figsize=(10, 6))
-sns.histplot(df['Profit'], bins=50, kde=True, color='lightgreen')
+sns.histplot(df['Profit'], bins=50, kde=False, color='lightgreen')
 plt.title('Profit Distribution')
 plt.xlabel('Profit')
 plt.ylabel('Frequency')
-plt.savefig('profit_distribution.png', dpi=300, bbox_inches='tight')
+plt.savefig('profit_distribution.png')
 plt.close()
 
 # Top 10 Products by Sales
@@ -66,7 +68,7 @@ sns.barplot(x=top_products.values, y=top_products.index, palette='viridis')
 plt.title('Top 10 Products by Total Sales')
 plt.xlabel('Total Sales')
 plt.ylabel('Product Name')
-plt.savefig('top_products_sales.png', dpi=300, bbox_inches='tight')
+plt.savefig('top_products_sales.png')
 plt.close()
 
 ## 6. Bivariate Analysis
@@ -78,7 +80,7 @@ plt.title('Sales vs Profit')
 plt.xlabel('Sales')
 plt.ylabel('Profit')
 plt.legend(title='Category')
-plt.savefig('sales_vs_profit.png', dpi=300, bbox_inches='tight')
+plt.savefig('sales_vs_profit.png')
 plt.close()
 
 # Discount vs Profit
@@ -88,7 +90,7 @@ plt.title('Discount vs Profit')
 plt.xlabel('Discount')
 plt.ylabel('Profit')
 plt.legend(title='Sub-Category')
-plt.savefig('discount_vs_profit.png', dpi=300, bbox_inches='tight')
+plt.savefig('discount_vs_profit.png')
 plt.close()
 
 # Region vs Profit
@@ -99,7 +101,7 @@ plt.title('Total Profit by Region')
 plt.xlabel('Region')
 plt.ylabel('Total Profit')
 plt.xticks(rotation=45)
-plt.savefig('profit_by_region.png', dpi=300, bbox_inches='tight')
+plt.savefig('profit_by_region.png')
 plt.close()
 
 ## 7. Advanced Insights
@@ -109,7 +111,7 @@ numeric_cols = ['Sales', 'Quantity', 'Discount', 'Profit']
 plt.figure(figsize=(8, 6))
 sns.heatmap(df[numeric_cols].corr(), annot=True, cmap='coolwarm')
 plt.title("Correlation Heatmap")
-plt.savefig('correlation_heatmap.png', dpi=300, bbox_inches='tight')
+plt.savefig('correlation_heatmap.png')
 plt.close()
 
 # Category-wise Profit Analysis
@@ -119,7 +121,7 @@ sns.barplot(x=cat_profit.index, y=cat_profit.values, palette='Set2')
 plt.title("Total Profit by Category")
 plt.ylabel("Profit")
 plt.xlabel("Category")
-plt.savefig('profit_by_category.png', dpi=300, bbox_inches='tight')
+plt.savefig('profit_by_category.png')
 plt.close()
 
 # Sub-category level insights
@@ -131,7 +133,7 @@ ax[0].set_title('Profit by Sub-Category')
 sns.barplot(x=sub_sales.values, y=sub_sales.index, ax=ax[1], palette='plasma')
 ax[1].set_title('Sales by Sub-Category')
 plt.tight_layout()
-plt.savefig('subcategory_analysis.png', dpi=300, bbox_inches='tight')
+plt.savefig('subcategory_analysis.png')
 plt.close()
 
 ## 8. Conclusion